@@ -58,6 +58,10 @@ class Config:
     # Streaming default
     STREAM_DEFAULT = os.environ.get('POCKET_TTS_STREAM_DEFAULT', 'true').lower() == 'true'
 
+    # Background workers that synthesize upcoming sentence groups of streamed
+    # requests ahead of playback; also the per-request look-ahead (1 = serial)
+    STREAM_CONCURRENCY = max(1, int(os.environ.get('POCKET_TTS_STREAM_CONCURRENCY', '1')))
+
     # Docker detection
     @staticmethod
     def _is_docker() -> bool:
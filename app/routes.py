@@ -3,7 +3,9 @@ Flask routes for the OpenAI-compatible TTS API.
 """
 
 import inspect
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 from apispec import APISpec
 from apispec.ext.marshmallow import MarshmallowPlugin
@@ -18,6 +20,7 @@ from flask import (
     stream_with_context,
 )
 
+from app.config import Config
 from app.logging_config import get_logger
 from app.services.audio import (
     convert_audio,
@@ -27,6 +30,7 @@ from app.services.audio import (
     write_wav_header,
 )
 from app.services.tts import get_tts_service
+from app.studio.chunking import chunk_text
 from app.studio.schemas import SpeechGenerationBody, request_body
 
 logger = get_logger('routes')
@@ -34,6 +38,54 @@ logger = get_logger('routes')
 # Create blueprint
 api = Blueprint('api', __name__)
 
+# Streamed input is split at sentence boundaries into chunks of up to this
+# many characters, so later chunks can be synthesized while earlier ones play
+STREAM_CHUNK_MAX_CHARS = 500
+
+# Shared pool that pre-generates upcoming stream chunks, created on first use
+_stream_executor: ThreadPoolExecutor | None = None
+_stream_executor_lock = threading.Lock()
+
+
+def _get_stream_executor() -> ThreadPoolExecutor:
+    """
+    Get the shared stream executor.
+
+    The pool has STREAM_CONCURRENCY workers and is shared across requests,
+    which bounds background synthesis server-wide. Each request keeps at most
+    STREAM_CONCURRENCY chunks queued on it (see _stream_audio), so one long
+    stream cannot starve the others.
+    """
+    global _stream_executor
+    with _stream_executor_lock:
+        if _stream_executor is None:
+            _stream_executor = ThreadPoolExecutor(
+                max_workers=Config.STREAM_CONCURRENCY,
+                thread_name_prefix='stream-tts',
+            )
+    return _stream_executor
+
+
+def _split_stream_text(text: str) -> list[str]:
+    """Group sentences into chunks of at most STREAM_CHUNK_MAX_CHARS.
+
+    A single sentence longer than the limit is kept whole.
+    """
+    chunks = []
+    current = ''
+    for sentence in chunk_text(text, strategy='sentence'):
+        sentence_text = sentence['text']
+        if current and len(current) + len(sentence_text) + 1 > STREAM_CHUNK_MAX_CHARS:
+            chunks.append(current)
+            current = sentence_text
+        elif not current:
+            current = sentence_text
+        else:
+            current += ' ' + sentence_text
+    if current:
+        chunks.append(current)
+    return chunks
+
 
 @api.route('/openapi.json')
 def openapi_spec():
@@ -77,8 +129,6 @@ def openapi_spec():
 @api.route('/')
 def home():
     """Serve the web interface."""
-    from app.config import Config
-
     return render_template('studio.html', is_docker=Config.IS_DOCKER, version=Config.VERSION)
 
 
@@ -234,9 +284,39 @@ def _stream_audio(tts, voice_state, text: str, fmt: str):
         stream_fmt = 'pcm'
 
     def generate():
-        stream = tts.generate_audio_stream(voice_state, text)
-        for chunk_tensor in stream:
-            yield tensor_to_pcm_bytes(chunk_tensor)
+        chunks = _split_stream_text(text) if Config.STREAM_CONCURRENCY > 1 else []
+
+        if len(chunks) <= 1:
+            for chunk_tensor in tts.generate_audio_stream(voice_state, text):
+                yield tensor_to_pcm_bytes(chunk_tensor)
+            return
+
+        # Bounded look-ahead: at most STREAM_CONCURRENCY chunks are queued or
+        # finished-but-unsent at a time, and chunk i + lookahead is only
+        # submitted once chunk i is taken. Synthesis stays ahead of playback
+        # without buffering the whole input in memory.
+        executor = _get_stream_executor()
+        lookahead = Config.STREAM_CONCURRENCY
+        futures = {}
+
+        def submit(index):
+            if index < len(chunks):
+                futures[index] = executor.submit(tts.generate_audio, voice_state, chunks[index])
+
+        for i in range(1, lookahead + 1):
+            submit(i)
+        try:
+            # The first chunk streams frame by frame from this thread
+            for chunk_tensor in tts.generate_audio_stream(voice_state, chunks[0]):
+                yield tensor_to_pcm_bytes(chunk_tensor)
+            for i in range(1, len(chunks)):
+                audio_tensor = futures.pop(i).result()
+                submit(i + lookahead)
+                yield tensor_to_pcm_bytes(audio_tensor)
+        finally:
+            # Client went away or synthesis failed: drop chunks not yet started
+            for future in futures.values():
+                future.cancel()
 
     def stream_with_header():
         # Yield WAV header first if streaming as WAV
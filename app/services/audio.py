@@ -62,13 +62,13 @@ def convert_audio(
     audio_np = audio_tensor.squeeze().cpu().numpy()
 
     try:
-        if target_format == 'wav':
-            import scipy.io.wavfile as wavfile
+        import soundfile as sf
 
-            wavfile.write(buffer, sample_rate, audio_np)
+        if target_format == 'wav':
+            # 16-bit PCM rather than 32-bit float: half the bytes on disk and over
+            # the wire. Clip first, libsndfile does not clamp on float -> int.
+            sf.write(buffer, audio_np.clip(-1.0, 1.0), sample_rate, format='WAV', subtype='PCM_16')
         else:
-            import soundfile as sf
-
             sf.write(buffer, audio_np, sample_rate, format=target_format.upper())
         buffer.seek(0)
         return buffer
@@ -132,11 +132,11 @@ def tensor_to_pcm_bytes(chunk_tensor: torch.Tensor) -> bytes:
     Returns:
         PCM audio bytes
     """
-    if chunk_tensor.dim() == 1:
-        chunk_tensor = chunk_tensor.unsqueeze(0)
-
-    # Convert to 16-bit PCM
-    pcm = (chunk_tensor * 32767).clamp(-32768, 32767).to(torch.int16)
+    # Convert to 16-bit PCM. Scale into one scratch float tensor and clamp it in
+    # place, so only that and the int16 result are allocated. The returned
+    # bytes are a fresh copy because WSGI servers may hold on to each yielded
+    # chunk after the next one is produced.
+    pcm = chunk_tensor.detach().cpu().mul(32767).clamp_(-32768, 32767).to(torch.int16)
     return pcm.numpy().tobytes()
 
 
@@ -5,7 +5,6 @@ TTS Service - handles model loading, voice management, and audio generation.
 import os
 import time
 from collections.abc import Iterator
-from pathlib import Path
 
 import torch
 
@@ -297,23 +296,27 @@ class TTSService:
         # Custom voices from directory
         custom_voices = []
         if self.voices_dir and os.path.isdir(self.voices_dir):
-            voice_dir = Path(self.voices_dir)
-
-            # Collect all valid files
-            voice_files = []
-            for ext in Config.VOICE_EXTENSIONS:
-                voice_files.extend(voice_dir.glob(f'*{ext}'))
+            # Collect all valid files in a single directory pass
+            with os.scandir(self.voices_dir) as entries:
+                voice_files = [
+                    entry.name
+                    for entry in entries
+                    if entry.name.endswith(Config.VOICE_EXTENSIONS)
+                    and not entry.name.startswith('.')
+                    and entry.is_file()
+                ]
 
             # Sort alphabetically by filename
-            voice_files.sort(key=lambda f: f.name.lower())
+            voice_files.sort(key=str.lower)
 
             for voice_file in voice_files:
                 # Format name: "bobby_mcfern" -> "Bobby Mcfern"
-                clean_name = voice_file.stem.replace('_', ' ').replace('-', ' ').title()
+                stem = os.path.splitext(voice_file)[0]
+                clean_name = stem.replace('_', ' ').replace('-', ' ').title()
 
                 custom_voices.append(
                     {
-                        'id': voice_file.name,
+                        'id': voice_file,
                         'name': clean_name,
                         'type': 'custom',
                     }
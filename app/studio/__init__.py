@@ -10,10 +10,13 @@ studio_bp = Blueprint('studio', __name__, url_prefix='/api/studio')
 def init_studio(app):
     """Register studio blueprint and initialize database."""
     from app.studio.db import close_db, init_db
+    from app.studio.normalizer import warmup as warmup_normalizer
 
     with app.app_context():
         init_db()
 
+    warmup_normalizer()
+
     app.teardown_appcontext(lambda exc: close_db())
 
     from app.studio import (
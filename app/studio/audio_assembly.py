@@ -2,7 +2,9 @@
 Audio assembly — merge chunk audio files into a single episode file.
 """
 
+import functools
 import os
+from math import gcd
 
 import scipy.signal
 import soundfile as sf
@@ -16,30 +18,52 @@ logger = get_logger('studio.audio_assembly')
 SILENCE_DURATION_SECS = 0.5
 
 
+@functools.lru_cache(maxsize=16)
+def _get_resample_filter(up: int, down: int):
+    """Design (once per rate pair) the low-pass FIR that resample_poly would build.
+
+    The taps are float32 like resample_poly's own filter for float32 input, so
+    the convolution stays in single precision and the output is unchanged.
+    resample_poly copies a window array before scaling it, so the cached
+    coefficients are never mutated.
+    """
+    max_rate = max(up, down)
+    half_len = 10 * max_rate
+    taps = scipy.signal.firwin(2 * half_len + 1, 1.0 / max_rate, window=('kaiser', 5.0))
+    return taps.astype('float32')
+
+
 def _load_audio(full_path: str, target_sr: int):
-    """Load audio file and resample if needed."""
+    """Load audio file as a mono (1, samples) tensor, resampling if needed."""
     audio, sr = sf.read(full_path, dtype='float32')
 
-    # Ensure 2D
-    if audio.ndim == 1:
-        audio = audio.reshape(1, -1)
+    # Downmix before resampling so only one channel goes through the filter.
+    # soundfile returns multichannel audio as (frames, channels).
+    if audio.ndim > 1:
+        audio = audio.mean(axis=1, dtype='float32')
+
+    audio = audio.reshape(1, -1)
 
-    # Resample if needed
+    # Resample if needed (polyphase filter with the reduced up/down ratio).
+    # float32 input and float32 taps give float32 output, so the cast below
+    # only guards the dtype and does not copy.
     if sr != target_sr:
-        num_samples = int(audio.shape[1] * target_sr / sr)
-        audio = scipy.signal.resample(audio, num_samples, axis=1)
+        g = gcd(sr, target_sr)
+        up, down = target_sr // g, sr // g
+        audio = scipy.signal.resample_poly(
+            audio, up, down, axis=1, window=_get_resample_filter(up, down)
+        ).astype('float32', copy=False)
 
     return torch.from_numpy(audio)
 
 
 def _save_audio(audio: torch.Tensor, sample_rate: int, fmt: str, output_path: str):
-    """Save audio tensor to file using scipy/soundfile."""
+    """Save audio tensor to file using soundfile."""
     audio_np = audio.squeeze().cpu().numpy()
 
     if fmt == 'wav':
-        import scipy.io.wavfile as wavfile
-
-        wavfile.write(output_path, sample_rate, audio_np)
+        # 16-bit PCM, matching the chunk files written by convert_audio
+        sf.write(output_path, audio_np.clip(-1.0, 1.0), sample_rate, subtype='PCM_16')
     else:
         sf.write(output_path, audio_np, sample_rate, format=fmt.upper())
 
@@ -57,32 +81,29 @@ def merge_chunks_to_episode(episode_id: str, chunk_paths: list[str], sample_rate
         Path to the merged audio file (relative to STUDIO_AUDIO_DIR)
     """
     audio_dir = Config.STUDIO_AUDIO_DIR
-    tensors = []
+    waveforms = []
 
-    # Create silence gap between chunks
-    silence_samples = int(SILENCE_DURATION_SECS * sample_rate)
-    silence = torch.zeros(1, silence_samples)
-
-    for i, rel_path in enumerate(chunk_paths):
+    for rel_path in chunk_paths:
         full_path = os.path.join(audio_dir, rel_path)
         if not os.path.exists(full_path):
             logger.warning(f'Chunk audio file not found: {full_path}')
             continue
 
-        waveform = _load_audio(full_path, sample_rate)
-
-        # Ensure mono
-        if waveform.shape[0] > 1:
-            waveform = waveform.mean(dim=0, keepdim=True)
+        waveforms.append(_load_audio(full_path, sample_rate))
 
-        tensors.append(waveform)
-        if i < len(chunk_paths) - 1:
-            tensors.append(silence)
-
-    if not tensors:
+    if not waveforms:
         raise ValueError('No audio chunks to merge')
 
-    merged = torch.cat(tensors, dim=1)
+    # Pre-size the output and copy each chunk in place, leaving silence gaps
+    # between chunks, instead of concatenating a list of chunk + silence tensors
+    silence_samples = int(SILENCE_DURATION_SECS * sample_rate)
+    total_samples = sum(w.shape[1] for w in waveforms) + silence_samples * (len(waveforms) - 1)
+    merged = torch.zeros(1, total_samples, dtype=torch.float32)
+
+    offset = 0
+    for waveform in waveforms:
+        merged[:, offset : offset + waveform.shape[1]].copy_(waveform)
+        offset += waveform.shape[1] + silence_samples
 
     # Determine format from first chunk path
     ext = os.path.splitext(chunk_paths[0])[1] if chunk_paths else '.wav'
@@ -90,13 +90,13 @@ def register_routes(bp) -> None:
             ),
         )
 
-        for chunk in chunks:
-            chunk_id = str(uuid.uuid4())
-            db.execute(
-                'INSERT INTO chunks (id, episode_id, chunk_index, text, status) '
-                'VALUES (?, ?, ?, ?, ?)',
-                (chunk_id, episode_id, chunk['index'], chunk['text'], 'pending'),
-            )
+        db.executemany(
+            'INSERT INTO chunks (id, episode_id, chunk_index, text, status) VALUES (?, ?, ?, ?, ?)',
+            [
+                (str(uuid.uuid4()), episode_id, chunk['index'], chunk['text'], 'pending')
+                for chunk in chunks
+            ],
+        )
 
         db.execute(
             'INSERT INTO playback_state (episode_id) VALUES (?)',
@@ -257,13 +257,13 @@ def register_routes(bp) -> None:
 
         db.execute('DELETE FROM chunks WHERE episode_id = ?', (episode_id,))
 
-        for chunk in chunks:
-            chunk_id = str(uuid.uuid4())
-            db.execute(
-                'INSERT INTO chunks (id, episode_id, chunk_index, text, status) '
-                'VALUES (?, ?, ?, ?, ?)',
-                (chunk_id, episode_id, chunk['index'], chunk['text'], 'pending'),
-            )
+        db.executemany(
+            'INSERT INTO chunks (id, episode_id, chunk_index, text, status) VALUES (?, ?, ?, ?, ?)',
+            [
+                (str(uuid.uuid4()), episode_id, chunk['index'], chunk['text'], 'pending')
+                for chunk in chunks
+            ],
+        )
 
         db.execute(
             'UPDATE episodes SET voice_id = ?, output_format = ?, chunk_strategy = ?, '
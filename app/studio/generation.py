@@ -11,6 +11,7 @@ import time
 from app.config import Config
 from app.logging_config import get_logger
 from app.studio.breathing import add_breathing
+from app.studio.db import open_connection
 
 logger = get_logger('studio.generation')
 
@@ -272,11 +273,7 @@ class GenerationQueue:
 
     def _get_db(self) -> sqlite3.Connection:
         """Get a database connection for the worker thread."""
-        db = sqlite3.connect(Config.STUDIO_DB_PATH)
-        db.row_factory = sqlite3.Row
-        db.execute('PRAGMA journal_mode=WAL')
-        db.execute('PRAGMA foreign_keys=ON')
-        return db
+        return open_connection()
 
 
 def get_generation_queue() -> GenerationQueue:
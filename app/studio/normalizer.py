@@ -4,11 +4,15 @@ Enhanced version with configurable cleaning rules.
 """
 
 import re
+import time
 
 from app.logging_config import get_logger
 
 logger = get_logger('studio.normalizer')
 
+# Shared markdown-it parser, created on first use
+_markdown_parser = None
+
 
 class CleaningOptions:
     """Configuration for text cleaning."""
@@ -154,6 +158,20 @@ def _strip_html_tags(text: str) -> str:
     return text.strip()
 
 
+def _get_markdown_parser():
+    """Get the shared MarkdownIt parser, importing markdown-it-py on first use.
+
+    Raises:
+        ImportError: If markdown-it-py is not installed
+    """
+    global _markdown_parser
+    if _markdown_parser is None:
+        from markdown_it import MarkdownIt
+
+        _markdown_parser = MarkdownIt()
+    return _markdown_parser
+
+
 def normalize_text(text: str, options: CleaningOptions | None = None) -> str:
     """
     Normalize text for TTS consumption with configurable rules.
@@ -172,7 +190,7 @@ def normalize_text(text: str, options: CleaningOptions | None = None) -> str:
     text = _strip_html_tags(text)
 
     try:
-        from markdown_it import MarkdownIt
+        md = _get_markdown_parser()
     except ImportError:
         logger.warning('markdown-it-py not available, falling back to basic normalization')
         return _basic_normalize(text, options)
@@ -181,12 +199,18 @@ def normalize_text(text: str, options: CleaningOptions | None = None) -> str:
     if options.handle_tables:
         text = _process_tables(text)
 
-    md = MarkdownIt()
     tokens = md.parse(text)
     result = []
     skip_until_close = None
+    # Block types currently open, so inline tokens can see their parent in O(1)
+    parent_stack: list[str] = []
 
     for token in tokens:
+        if token.type.endswith('_open'):
+            parent_stack.append(token.type[:-5])
+        elif token.type.endswith('_close') and parent_stack:
+            parent_stack.pop()
+
         if skip_until_close:
             if token.type == skip_until_close:
                 skip_until_close = None
@@ -218,8 +242,8 @@ def normalize_text(text: str, options: CleaningOptions | None = None) -> str:
         if token.type == 'inline':
             line = _process_inline(token, options)
             if line:
-                # Check if previous token was a heading
-                parent_type = _get_parent_type(tokens, token)
+                # Check if the enclosing block is a heading
+                parent_type = parent_stack[-1] if parent_stack else None
                 if parent_type and parent_type.startswith('heading'):
                     result.append(f'Section: {line}.')
                 else:
@@ -455,16 +479,6 @@ def _clean_code_content(code: str, options: CleaningOptions) -> str:
     return _light_clean(code, options.preserve_parentheses)
 
 
-def _get_parent_type(tokens, target_token) -> str | None:
-    """Find the opening token type for an inline token."""
-    for i, t in enumerate(tokens):
-        if t is target_token and i > 0:
-            prev = tokens[i - 1]
-            if prev.type.endswith('_open'):
-                return prev.type.replace('_open', '')
-    return None
-
-
 def _final_clean(text: str, options: CleaningOptions) -> str:
     """Final whitespace normalization - preserve structure."""
 
@@ -482,6 +496,37 @@ def _final_clean(text: str, options: CleaningOptions) -> str:
     return text.strip()
 
 
+# Line-level patterns for the markdown-it-free fallback, compiled once
+_RE_LINK = re.compile(r'\[([^\]]+)\]\([^)]+\)')
+_RE_IMAGE = re.compile(r'!\[([^\]]*)\]\([^)]+\)')
+_RE_BOLD_ITALIC = re.compile(r'\*{1,3}([^*]+)\*{1,3}')
+_RE_UNDERSCORE_EMPHASIS = re.compile(r'_{1,3}([^_]+)_{1,3}')
+_RE_INLINE_CODE = re.compile(r'`([^`]+)`')
+_RE_TABLE_SEPARATOR = re.compile(r'^[\|\-\:\s]+$')
+_RE_BULLET_ITEM = re.compile(r'^[\-\*\+]\s+(.+)$')
+_RE_ORDERED_ITEM = re.compile(r'^(\d+)\.\s+(.+)$')
+_RE_HR = re.compile(r'^[-*_]{3,}$')
+_INLINE_MARKDOWN_CHARS = frozenset('[*_`')
+
+
+def _strip_inline_markdown(line: str, options: CleaningOptions) -> str:
+    """Strip links, images, emphasis and inline code from a single line."""
+    # Most prose lines carry no markdown at all; skip the substitutions for them
+    if _INLINE_MARKDOWN_CHARS.isdisjoint(line):
+        return line
+
+    line = _RE_LINK.sub(r'\1', line)
+    line = _RE_IMAGE.sub(r'(Image: \1)', line)
+    line = _RE_BOLD_ITALIC.sub(r'\1', line)
+    line = _RE_UNDERSCORE_EMPHASIS.sub(r'\1', line)
+    return _RE_INLINE_CODE.sub(
+        lambda m: (
+            _clean_code_content(m.group(1), options) if options.code_block_rule == 'read' else ''
+        ),
+        line,
+    )
+
+
 def _basic_normalize(text: str, options: CleaningOptions) -> str:
     """Basic normalization without markdown-it-py."""
 
@@ -516,7 +561,7 @@ def _basic_normalize(text: str, options: CleaningOptions) -> str:
             continue
 
         # Skip table separator lines
-        if re.match(r'^[\|\-\:\s]+$', stripped):
+        if _RE_TABLE_SEPARATOR.match(stripped):
             continue
 
         # Process table rows (basic)
@@ -546,8 +591,8 @@ def _basic_normalize(text: str, options: CleaningOptions) -> str:
             continue
 
         # List items
-        list_match = re.match(r'^[\-\*\+]\s+(.+)$', stripped)
-        ordered_match = re.match(r'^(\d+)\.\s+(.+)$', stripped)
+        list_match = _RE_BULLET_ITEM.match(stripped)
+        ordered_match = _RE_ORDERED_ITEM.match(stripped)
 
         if list_match or ordered_match:
             if not in_list and options.preserve_structure and result and not last_was_heading:
@@ -555,22 +600,7 @@ def _basic_normalize(text: str, options: CleaningOptions) -> str:
             in_list = True
 
             content = list_match.group(1) if list_match else ordered_match.group(2)
-            line = _clean_text(content, options)
-
-            # Links and images
-            line = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', line)
-            line = re.sub(r'!\[([^\]]*)\]\([^)]+\)', r'(Image: \1)', line)
-            line = re.sub(r'\*{1,3}([^*]+)\*{1,3}', r'\1', line)
-            line = re.sub(r'_{1,3}([^_]+)_{1,3}', r'\1', line)
-            line = re.sub(
-                r'`([^`]+)`',
-                lambda m: (
-                    _clean_code_content(m.group(1), options)
-                    if options.code_block_rule == 'read'
-                    else ''
-                ),
-                line,
-            )
+            line = _strip_inline_markdown(_clean_text(content, options), options)
 
             if line:
                 result.append(line)
@@ -584,23 +614,10 @@ def _basic_normalize(text: str, options: CleaningOptions) -> str:
                 result.append('\n')
 
         # Process regular inline elements
-        line = _clean_text(stripped, options)
-        line = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', line)
-        line = re.sub(r'!\[([^\]]*)\]\([^)]+\)', r'(Image: \1)', line)
-        line = re.sub(r'\*{1,3}([^*]+)\*{1,3}', r'\1', line)
-        line = re.sub(r'_{1,3}([^_]+)_{1,3}', r'\1', line)
-        line = re.sub(
-            r'`([^`]+)`',
-            lambda m: (
-                _clean_code_content(m.group(1), options)
-                if options.code_block_rule == 'read'
-                else ''
-            ),
-            line,
-        )
+        line = _strip_inline_markdown(_clean_text(stripped, options), options)
 
         # Horizontal rules
-        if re.match(r'^[-*_]{3,}$', stripped):
+        if _RE_HR.match(stripped):
             if options.preserve_structure and result:
                 result.append('\n' * options.section_spacing)
             continue
@@ -615,6 +632,17 @@ def _basic_normalize(text: str, options: CleaningOptions) -> str:
     return _final_clean(''.join(result), options)
 
 
+def warmup() -> None:
+    """Run one small document through normalize_text at startup.
+
+    Imports markdown-it-py, builds the shared parser and fills re's pattern
+    cache, so the first real import request doesn't pay for it.
+    """
+    t0 = time.time()
+    normalize_text('# Warmup\n\nSee [docs](https://example.com), e.g. **this** `code`.')
+    logger.debug(f'Normalizer warmed up in {time.time() - t0:.3f}s')
+
+
 # Backward compatibility function
 def normalize_text_compat(text: str, code_block_rule: str = 'skip') -> str:
     """Backward compatible normalize_text function."""
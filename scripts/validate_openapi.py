@@ -14,6 +14,11 @@ import sys
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
 SPEC_PATH = os.path.join(
     os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'openapi.yaml'
 )
@@ -21,7 +26,7 @@ SPEC_PATH = os.path.join(
 
 def validate_spec(spec_path: str) -> list[str]:
     with open(spec_path) as f:
-        spec = yaml.safe_load(f)
+        spec = yaml.load(f, Loader=SafeLoader)
 
     issues: list[str] = []
     paths = spec.get('paths', {})